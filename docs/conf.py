@@ -15,7 +15,7 @@ import sys
 # sys.path.insert(len(sys.path), root_directory)
 
 from dwave.samplers import __version__ as version
-from dwave.samplers import __version__ as release
+release = version
 
 # -- Project information - these are special values used by sphinx. -------
 
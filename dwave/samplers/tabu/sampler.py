@@ -14,6 +14,9 @@
 
 """A dimod :term:`sampler` that uses the MST2 multistart tabu search algorithm."""
 
+import concurrent.futures
+import os
+
 import numpy as np
 import dimod
 
@@ -25,6 +28,15 @@ from dwave.samplers.tabu import TabuSearch
 __all__ = ["TabuSampler"]
 
 
+def _available_cpus() -> int:
+    """Return the number of CPUs this process is allowed to run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # not available on all platforms, e.g. Windows and macOS
+        return os.cpu_count() or 1
+
+
 class TabuSampler(dimod.Sampler, dimod.Initialized):
     """A tabu-search sampler.
 
@@ -124,7 +136,8 @@ class TabuSampler(dimod.Sampler, dimod.Initialized):
                 a maximum value of 20.
 
             timeout:
-                Maximum running time per read in milliseconds.
+                Maximum running time per read in milliseconds. Reads are run
+                in parallel, one per available CPU.
 
             num_restarts:
                 Maximum number of tabu search restarts per read. Setting this value
@@ -176,31 +189,59 @@ class TabuSampler(dimod.Sampler, dimod.Initialized):
         elif not 0 <= tenure < len(bqm):
             raise ValueError("'tenure' should be an integer in range [0, num_vars - 1]")
 
-        # Get initial_states in binary form
-        parsed = self.parse_initial_states(bqm.binary,
+        # Get initial_states in the bqm's vartype, we convert them to binary
+        # ourselves below rather than have dimod copy them into a new sample set
+        parsed = self.parse_initial_states(bqm,
                                            initial_states=initial_states,
                                            initial_states_generator=initial_states_generator,
                                            num_reads=num_reads,
                                            seed=seed)
 
-        parsed_initial_states = np.ascontiguousarray(parsed.initial_states.record.sample)
-
         qubo, varorder = self._bqm_to_tabu_qubo(bqm.binary)
 
+        # gather the initial states' columns into the qubo's variable order
+        # once, in the dtype TabuSearch expects, so each read can be handed
+        # a row directly without another conversion
+        parsed_initial_states = parsed.initial_states.record.sample
+        variables = parsed.initial_states.variables
+        if variables != varorder:
+            col_index = np.fromiter(map(variables.index, varorder), dtype=np.intp, count=len(varorder))
+            parsed_initial_states = parsed_initial_states.take(col_index, axis=1)
+        if bqm.vartype is dimod.SPIN:
+            parsed_initial_states = (parsed_initial_states + 1) // 2
+        parsed_initial_states = np.ascontiguousarray(parsed_initial_states, dtype=np.intc)
+
         if timeout is None:
             timeout = -1    # Using negative timeout to mean ignore timeout parameter
 
         # run Tabu search
         samples = np.empty((parsed.num_reads, len(bqm)), dtype=np.int8)
 
+        # draw the per-read seeds up front, in read order, so that results do
+        # not depend on the order in which the reads are scheduled
         rng = np.random.default_rng(seed)
+        seeds = [rng.integers(2**32, dtype=np.uint32) for _ in range(parsed.num_reads)]
 
-        restarts = []
-        for ni, initial_state in enumerate(parsed_initial_states):
-            seed_per_read = rng.integers(2**32, dtype=np.uint32)
+        def search(initial_state, seed_per_read):
+            # TabuSearch releases the GIL while searching, so reads run in parallel.
+            # Only the results are returned so that each search, and its copy
+            # of the qubo, is freed as soon as the read is done
             r = TabuSearch(qubo, initial_state, tenure, timeout, num_restarts, seed_per_read, energy_threshold, coefficient_z_first, coefficient_z_restart, lower_bound_z)
-            samples[ni, :] = r.bestSolution()
-            restarts.append(r.numRestarts())
+            return r.bestSolution(), r.numRestarts()
+
+        num_workers = min(parsed.num_reads, _available_cpus())
+        if num_workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+                results = list(executor.map(search, parsed_initial_states, seeds))
+        else:
+            # not worth starting a thread pool, e.g. for a single read, so
+            # run each search lazily as its result is stored below
+            results = map(search, parsed_initial_states, seeds)
+
+        restarts = []
+        for ni, (solution, num_restarts_per_read) in enumerate(results):
+            samples[ni, :] = solution
+            restarts.append(num_restarts_per_read)
 
         # we received samples in binary form, so convert if needed
         if bqm.vartype is dimod.SPIN:
@@ -216,12 +257,14 @@ class TabuSampler(dimod.Sampler, dimod.Initialized):
     def _bqm_to_tabu_qubo(bqm):
         # construct dense matrix representation
         ldata, (irow, icol, qdata), offset, varorder = bqm.binary.to_numpy_vectors(return_labels=True)
-        ud = np.zeros((len(bqm), len(bqm)), dtype=np.double)
-        ud[np.diag_indices(len(bqm), 2)] = ldata
-        ud[irow, icol] = qdata
+        symm = np.zeros((len(bqm), len(bqm)), dtype=np.double)
+        np.fill_diagonal(symm, ldata)
 
         # Note: normally, conversion would be: `ud + ud.T - np.diag(np.diag(ud))`,
-        # but the Tabu solver we're using requires slightly different qubo matrix.
-        ud *= .5
-        symm = ud + ud.T
+        # but the Tabu solver we're using requires slightly different qubo matrix,
+        # with the quadratic biases split evenly between the two triangles.
+        # Write both halves in place rather than materializing `ud + ud.T`.
+        half = .5 * qdata
+        symm[irow, icol] = half
+        symm[icol, irow] = half
         return symm, varorder
@@ -21,7 +21,7 @@
 
 using std::vector;
 
-BQP::BQP(std::vector<std::vector<double>> Q) 
+BQP::BQP(const std::vector<std::vector<double>> &Q) 
     : Q(Q), 
       nVars(Q.size()), 
       solutionQuality{0},
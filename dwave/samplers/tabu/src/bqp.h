@@ -21,7 +21,7 @@
 class BQP 
 {
     public:
-        BQP(std::vector<std::vector<double>> Q);
+        BQP(const std::vector<std::vector<double>> &Q);
 
         /**
          * Calls toUpperTriangular() and sets the solution
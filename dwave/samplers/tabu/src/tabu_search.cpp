@@ -22,7 +22,7 @@
 using std::vector;
 using std::size_t;
 
-TabuSearch::TabuSearch(vector<vector<double>> Q, 
+TabuSearch::TabuSearch(const vector<vector<double>> &Q, 
                        const vector<int> initSol, 
                        int tenure, 
                        long int timeout,
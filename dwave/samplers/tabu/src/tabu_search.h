@@ -31,7 +31,7 @@ typedef struct bqpSolver_Callback {
 class TabuSearch
 {
     public:
-        TabuSearch(std::vector<std::vector<double>> Q, 
+        TabuSearch(const std::vector<std::vector<double>> &Q, 
                    const std::vector<int> initSol, 
                    int tenure, 
                    long int timeout, 
@@ -45,13 +45,9 @@ cdef class TabuSearch:
         cdef int _coeffZRestart = -1 if coeffZRestart is None else coeffZRestart
         cdef int _lowerBoundZ = -1 if lowerBoundZ is None else lowerBoundZ
 
-        cdef double[:,:] qubo = np.asarray(Q, dtype=np.double)
+        cdef const double[:, ::1] qubo = np.ascontiguousarray(Q, dtype=np.double)
         cdef vector[vector[double]] Qvec
-        Qvec.resize(qubo.shape[0])
-        cdef Py_ssize_t i, j
-        for i in range(qubo.shape[0]):
-            for j in range(qubo.shape[1]):
-                Qvec[i].push_back(qubo[i, j])
+        cdef Py_ssize_t i
 
         cdef int[:] initial = np.asarray(initSol, dtype=np.intc)
         cdef vector[int] initVec
@@ -59,6 +55,13 @@ cdef class TabuSearch:
             initVec.push_back(initial[i])
 
         with nogil:
+            # copy the rows in bulk, without holding the GIL, so concurrent
+            # searches do not serialize on the conversion
+            Qvec.resize(qubo.shape[0])
+            if qubo.shape[1]:
+                for i in range(qubo.shape[0]):
+                    Qvec[i].assign(&qubo[i, 0], &qubo[i, 0] + qubo.shape[1])
+
             self.c_tabu = new dwave.samplers.tabu.tabu.TabuSearch(
                 Qvec, initVec, tenure, timeout, numRestarts, _seed, _energyThreshold,
                 _coeffZFirst, _coeffZRestart, _lowerBoundZ)
@@ -70,7 +73,14 @@ cdef class TabuSearch:
         return self.c_tabu.bestEnergy()
 
     def bestSolution(self):
-        return self.c_tabu.bestSolution()
+        # copy straight into an array rather than via a list of Python ints
+        cdef vector[int] solution = self.c_tabu.bestSolution()
+        best = np.empty(solution.size(), dtype=np.intc)
+        cdef int[:] best_view = best
+        cdef Py_ssize_t i
+        for i in range(best_view.shape[0]):
+            best_view[i] = solution[i]
+        return best
 
     def numRestarts(self):
         return self.c_tabu.numRestarts()
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Optional
+import collections.abc
+
+from typing import List, Optional, Tuple
 
 import dimod
 import numpy as np
@@ -26,6 +28,91 @@ from dwave.samplers.tree.utilities import elimination_order_width, min_fill_heur
 __all__ = ['TreeDecompositionSolver', 'TreeDecompositionSampler']
 
 
+class _InteractionMarginals(collections.abc.Mapping):
+    """Interaction marginals, stored as flat arrays.
+
+    A mapping of the form ``{(u, v): {(s, t): p, ...}, ...}``, where
+    ``(u, v)`` is an interaction in the binary quadratic model and
+    ``p = prob(u == s & v == t)``. The ``{(s, t): p, ...}`` dicts are
+    constructed on access, the underlying data is available in
+    :attr:`interactions` and :attr:`marginals`.
+
+    Args:
+        variables: Variable labels, indexed by the linear indices in
+            ``interactions``.
+        interactions: ``(num_interactions, 2)`` array of linear indices.
+        marginals: ``(num_interactions, 4)`` array of probabilities, one per
+            configuration in ``configs``.
+        configs: The four ``(s, t)`` configurations of an interaction.
+
+    """
+    def __init__(self, variables, interactions, marginals, configs):
+        self.variables = variables
+        self.interactions = np.asarray(interactions, dtype=np.intc).reshape(-1, 2)
+        self.marginals = np.asarray(marginals, dtype=np.double).reshape(-1, 4)
+        self.configs = configs
+        self._index = None
+
+    def _interaction_index(self) -> dict:
+        # map each (u, v) to its row, built the first time it is needed
+        if self._index is None:
+            variables = self.variables
+            self._index = {(variables[i], variables[j]): row
+                           for row, (i, j) in enumerate(self.interactions.tolist())}
+        return self._index
+
+    def __getitem__(self, interaction):
+        row = self._interaction_index()[interaction]
+        return dict(zip(self.configs, self.marginals[row]))
+
+    def __iter__(self):
+        return iter(self._interaction_index())
+
+    def __len__(self):
+        return len(self.interactions)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class _MinFillCache:
+    """Least-recently-used cache of :func:`min_fill_heuristic` results.
+
+    Results are keyed on the structure of the binary quadratic model, i.e. its
+    variables (in order) and interactions, so repeated calls on the same model,
+    or on models that differ only in their biases, reuse the elimination order.
+
+    Args:
+        maxsize: Maximum number of elimination orders to keep.
+
+    """
+    def __init__(self, maxsize: int = 16):
+        self.maxsize = maxsize
+        self._orders = collections.OrderedDict()
+
+    def __call__(self, bqm: dimod.BinaryQuadraticModel) -> Tuple[int, List[Variable]]:
+        # build the key from the index vectors rather than walking the
+        # adjacency in Python, ordering each interaction and then the
+        # interactions themselves so that the key does not depend on how
+        # the model was constructed
+        _, (irow, icol, _), _ = bqm.to_numpy_vectors()
+        interactions = np.stack((np.minimum(irow, icol), np.maximum(irow, icol)))
+        interactions = interactions[:, np.lexsort(interactions[::-1])]
+        key = (tuple(bqm.variables), interactions.tobytes())
+
+        try:
+            tree_width, elimination_order = self._orders[key]
+        except KeyError:
+            tree_width, elimination_order = min_fill_heuristic(bqm)
+            self._orders[key] = tree_width, tuple(elimination_order)
+            if len(self._orders) > self.maxsize:
+                self._orders.popitem(last=False)
+        else:
+            self._orders.move_to_end(key)
+
+        return tree_width, list(elimination_order)
+
+
 class TreeDecompositionSolver(dimod.Sampler):
     """Tree decomposition-based solver for binary quadratic models.
 
@@ -97,6 +184,8 @@ class TreeDecompositionSolver(dimod.Sampler):
         self.parameters = dict(self.parameters)
         self.properties = dict(self.properties)
 
+        self._min_fill_cache = _MinFillCache()
+
     def sample(self, bqm: dimod.BinaryQuadraticModel, num_reads: Optional[int] = 1,
                elimination_order: Optional[List[Variable]] = None) -> dimod.SampleSet:
         """Find ground states of a binary quadratic model.
@@ -138,7 +227,7 @@ class TreeDecompositionSolver(dimod.Sampler):
         max_samples = min(num_reads, 2**len(bqm))
 
         if elimination_order is None:
-            tree_width, elimination_order = min_fill_heuristic(bqm)
+            tree_width, elimination_order = self._min_fill_cache(bqm)
         else:
             tree_width = elimination_order_width(bqm, elimination_order)
 
@@ -155,11 +244,16 @@ class TreeDecompositionSolver(dimod.Sampler):
         max_complexity = tree_width + 1
 
         # relabel bqm variables so that we only work with linear indices
-        bqm_copy, int_to_var = bqm.relabel_variables_as_integers(inplace=False)
-        var_to_int = {v: k for k, v in int_to_var.items()}
+        if bqm.variables.is_range:
+            # already linearly indexed, so skip the copy. The elimination
+            # order is then already in terms of linear indices as well
+            bqm_copy = bqm
+        else:
+            bqm_copy, _ = bqm.relabel_variables_as_integers(inplace=False)
 
-        # relabel variables in the elimination order as well
-        elimination_order = [var_to_int.get(var, var) for var in elimination_order]
+            # relabel variables in the elimination order as well. Variable `v`
+            # is relabelled to its index in `bqm.variables`
+            elimination_order = list(map(bqm.variables.index, elimination_order))
 
         samples, energies = solve_bqm_wrapper(bqm=bqm_copy,
                                               order=elimination_order,
@@ -169,10 +263,9 @@ class TreeDecompositionSolver(dimod.Sampler):
 
         # if we asked for more than the total number of distinct samples, we
         # just resample again starting from the beginning
-        num_occurrences = np.ones(max_samples, dtype=np.intc)
-        if num_reads > max_samples:
-            q, r = divmod(num_reads, max_samples)
-            num_occurrences *= q
+        q, r = divmod(num_reads, max_samples)
+        num_occurrences = np.full(max_samples, q, dtype=np.intc)
+        if r:
             num_occurrences[:r] += 1
 
         return dimod.SampleSet.from_samples((samples, bqm.variables),
@@ -230,6 +323,8 @@ class TreeDecompositionSampler(dimod.Sampler):
         self.parameters = dict(self.parameters)
         self.properties = dict(self.properties)
 
+        self._min_fill_cache = _MinFillCache()
+
     def sample(self, bqm: dimod.BinaryQuadraticModel, num_reads: Optional[int] = 1,
                elimination_order: Optional[List[Variable]] = None, beta: Optional[float] = 1.0,
                marginals: Optional[bool] = True, seed: Optional[int] = None) -> dimod.SampleSet:
@@ -270,10 +365,14 @@ class TreeDecompositionSampler(dimod.Sampler):
                 * ``'variable_marginals'``: Dict of the form ``{v: p, ...}``, where
                   ``v`` is a variable in the binary quadratic model and
                   ``p = prob(v == 1)``.
-                * ``'interaction_marginals'``: Dict of the form
+                * ``'interaction_marginals'``: Mapping of the form
                   ``{(u, v): {(s, t): p, ...}, ...}``, where ``(u, v)`` is an
                   interaction in the binary quadratic model and
-                  ``p = prob(u == s & v == t)``.
+                  ``p = prob(u == s & v == t)``. The per-interaction dicts
+                  are constructed on access. The underlying arrays are
+                  available as its ``interactions``, an array of indices
+                  into ``variables``, and ``marginals``, with one column
+                  per configuration in ``configs``.
 
         Raises:
             ValueError:
@@ -300,7 +399,7 @@ class TreeDecompositionSampler(dimod.Sampler):
 
         if elimination_order is None:
             # note that this does not respect the given seed
-            tree_width, elimination_order = min_fill_heuristic(bqm)
+            tree_width, elimination_order = self._min_fill_cache(bqm)
         else:
             # this also checks the order against the bqm
             tree_width = elimination_order_width(bqm, elimination_order)
@@ -316,11 +415,16 @@ class TreeDecompositionSampler(dimod.Sampler):
                 )
 
         # relabel bqm variables so that we only work with linear indices
-        bqm_copy, int_to_var = bqm.relabel_variables_as_integers(inplace=False)
-        var_to_int = {v: k for k, v in int_to_var.items()}
+        if bqm.variables.is_range:
+            # already linearly indexed, so skip the copy. The elimination
+            # order is then already in terms of linear indices as well
+            bqm_copy = bqm
+        else:
+            bqm_copy, _ = bqm.relabel_variables_as_integers(inplace=False)
 
-        # relabel variables in the elimination order as well
-        elimination_order = [var_to_int.get(var, var) for var in elimination_order]
+            # relabel variables in the elimination order as well. Variable `v`
+            # is relabelled to its index in `bqm.variables`
+            elimination_order = list(map(bqm.variables.index, elimination_order))
 
         max_complexity = tree_width + 1
 
@@ -335,21 +439,20 @@ class TreeDecompositionSampler(dimod.Sampler):
         info = {'log_partition_function': data['log_partition_function']}
 
         if marginals:
-            info['variable_marginals'] = {}
-            for i in elimination_order:
-                info['variable_marginals'][int_to_var.get(i, i)] = data['variable_marginals'][i]
+            info['variable_marginals'] = dict(zip(
+                map(bqm.variables.__getitem__, elimination_order),
+                data['variable_marginals'][np.asarray(elimination_order, dtype=np.intp)]))
 
-            info['interaction_marginals'] = {}
+            # kept as arrays, the per-interaction dicts are only built if accessed
             low = -1 if bqm.vartype is dimod.SPIN else 0
             configs = (low, low), (1, low), (low, 1), (1, 1)
-            for (i, j), probs in zip(data['interactions'],
-                                     data['interaction_marginals']):
-                u = int_to_var.get(i, i)
-                v = int_to_var.get(j, j)
-                info['interaction_marginals'][(u, v)] = dict(zip(configs, probs))
-
-        energies = bqm.energies((samples, bqm.variables),
-                                dtype=energies_dtype)
+            info['interaction_marginals'] = _InteractionMarginals(
+                bqm.variables, data['interactions'], data['interaction_marginals'], configs)
+
+        # the sampler does not track energies, but the columns of `samples`
+        # are already in the linear order of `bqm_copy`, so no labels need
+        # to be matched up
+        energies = bqm_copy.energies(samples, dtype=energies_dtype)
 
         return dimod.SampleSet.from_samples((samples, bqm.variables),
                                             bqm.vartype,
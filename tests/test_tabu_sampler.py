@@ -14,12 +14,15 @@
 
 """Test the TabuSampler python interface."""
 
+import math
 import unittest
+import unittest.mock
 
 import dimod
 import numpy as np
 
 import dwave.samplers.tabu as tabu
+from dwave.samplers.tabu.sampler import _available_cpus
 from dwave.samplers.tabu.utils import tictoc
 
 
@@ -100,6 +103,18 @@ class TestTabuSampler(unittest.TestCase):
         resp = tabu.TabuSampler().sample(bqm, initial_states=init)
         dimod.testing.assert_response_energies(resp, bqm)
 
+    def test_initial_states_variable_order(self):
+        # labels that cannot be sorted, given in an order that differs from
+        # the one the qubo is constructed in
+        bqm = dimod.BinaryQuadraticModel({'c': 1, 'a': -1, 1: 1}, {}, 0, dimod.SPIN)
+        init = dimod.SampleSet.from_samples(([[1, -1, -1]], [1, 'a', 'c']), dimod.SPIN, energy=0)
+
+        # no variable updates, so the initial state is returned as is
+        resp = tabu.TabuSampler().sample(bqm, initial_states=init, timeout=None,
+                                         num_restarts=0, coefficient_z_first=0,
+                                         lower_bound_z=0)
+        self.assertEqual(resp.first.sample, {1: 1, 'a': -1, 'c': -1})
+
     def test_initial_states_generator(self):
         bqm = dimod.BinaryQuadraticModel.from_ising({}, {'ab': -1, 'bc': 1, 'ac': 1})
         init = dimod.SampleSet.from_samples_bqm([{'a': 1, 'b': 1, 'c': 1},
@@ -234,15 +249,49 @@ class TestTabuSampler(unittest.TestCase):
             response = sampler.sample(bqm, num_reads=1, timeout=500, seed=123)
         self.assertAlmostEqual(tt.dt, 0.5, places=1)
 
+        # reads are run in parallel, one per available CPU
+        def rounds(num_reads):
+            return math.ceil(num_reads / _available_cpus())
+
         with tictoc() as tt:
             response = sampler.sample(bqm, num_reads=3, timeout=200, seed=123)
-        self.assertAlmostEqual(tt.dt, 0.6, places=1)
+        self.assertAlmostEqual(tt.dt, 0.2 * rounds(3), places=1)
 
         #Run as simple-tabu-search with timeout:
         with tictoc() as tt:
             response = sampler.sample(bqm, num_reads=2, timeout=300, seed=123,
                                       num_restarts=0, lower_bound_z= 2147483647)
-        self.assertAlmostEqual(tt.dt, 0.6, places=1)
+        self.assertAlmostEqual(tt.dt, 0.3 * rounds(2), places=1)
+
+    def test_seed_num_reads(self):
+        sampler = tabu.TabuSampler()
+        bqm = dimod.generators.random.randint(10, dimod.SPIN, low=1, high=1)
+
+        response0 = sampler.sample(bqm, num_reads=8, tenure=5, num_restarts=1, timeout=None, seed=42)
+        response1 = sampler.sample(bqm, num_reads=8, tenure=5, num_restarts=1, timeout=None, seed=42)
+
+        np.testing.assert_array_equal(response0.record.sample, response1.record.sample)
+
+    def test_parallel_reads(self):
+        bqm = dimod.generators.random.uniform(16, dimod.BINARY, low=-1, high=1, seed=123)
+        ground_energy = dimod.ExactSolver().sample(bqm).first.energy
+
+        # stop each read at the ground state, so the number of restarts
+        # differs between reads. The threshold does not include the offset
+        kwargs = dict(num_reads=8, seed=5, timeout=None, num_restarts=1000,
+                      energy_threshold=ground_energy - bqm.offset + 1e-6,
+                      coefficient_z_first=0, coefficient_z_restart=0, lower_bound_z=0)
+
+        with unittest.mock.patch('dwave.samplers.tabu.sampler._available_cpus', return_value=1):
+            serial = tabu.TabuSampler().sample(bqm, **kwargs)
+
+        with unittest.mock.patch('dwave.samplers.tabu.sampler._available_cpus', return_value=4):
+            parallel = tabu.TabuSampler().sample(bqm, **kwargs)
+
+        self.assertGreater(len(set(serial.record.num_restarts)), 1)
+        np.testing.assert_array_equal(serial.record.sample, parallel.record.sample)
+        np.testing.assert_array_equal(serial.record.num_restarts, parallel.record.num_restarts)
+        dimod.testing.assert_response_energies(parallel, bqm)
 
     def test_num_restarts(self):
         sampler = tabu.TabuSampler()
@@ -306,3 +355,17 @@ class TestTabuSampler(unittest.TestCase):
         self.assertLess(response.record.energy[0], num_var)
         self.assertGreater(response.record.energy[0], -num_var)
 
+
+    def test_bqm_to_tabu_qubo(self):
+        bqm = dimod.generators.gnp_random_bqm(20, .5, 'BINARY', random_state=42)
+
+        qubo, varorder = tabu.TabuSampler._bqm_to_tabu_qubo(bqm)
+
+        ldata, (irow, icol, qdata), _ = bqm.to_numpy_vectors(variable_order=varorder)
+        ud = np.zeros((len(bqm), len(bqm)))
+        ud[np.diag_indices(len(bqm), 2)] = ldata
+        ud[irow, icol] = qdata
+        ud *= .5
+
+        np.testing.assert_array_equal(qubo, ud + ud.T)
+        np.testing.assert_array_equal(qubo, qubo.T)
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import collections
+import collections.abc
 import inspect
 import itertools
 import unittest
@@ -83,6 +83,33 @@ class TestSample(unittest.TestCase):
 
         self.assertEqual(set(sampleset.info), set(sampleset_empty.info))
 
+    def test_interaction_marginals_mapping(self):
+        bqm = dimod.BinaryQuadraticModel.from_ising({'a': -1}, {'ab': 1, 'bc': -1})
+
+        sampleset = TreeDecompositionSampler().sample(bqm, marginals=True)
+        interaction_marginals = sampleset.info['interaction_marginals']
+
+        self.assertIsInstance(interaction_marginals, collections.abc.Mapping)
+        self.assertEqual(len(interaction_marginals), 2)
+        self.assertEqual({frozenset(pair) for pair in interaction_marginals},
+                         {frozenset('ab'), frozenset('bc')})
+        for pair, combos in interaction_marginals.items():
+            self.assertEqual(set(combos), {(-1, -1), (1, -1), (-1, 1), (1, 1)})
+            self.assertAlmostEqual(sum(combos.values()), 1)
+            self.assertEqual(interaction_marginals[pair], combos)
+
+        self.assertEqual(interaction_marginals.interactions.shape, (2, 2))
+        self.assertEqual(interaction_marginals.marginals.shape, (2, 4))
+        np.testing.assert_allclose(interaction_marginals.marginals.sum(axis=1), 1)
+
+    def test_elimination_order_index_labelled(self):
+        bqm = dimod.BinaryQuadraticModel.from_ising({0: -1}, {(0, 1): 1, (1, 2): -1})
+
+        sampleset = TreeDecompositionSampler().sample(bqm, elimination_order=(2, 0, 1))
+
+        dimod.testing.assert_response_energies(sampleset, bqm)
+        self.assertEqual(list(sampleset.info['variable_marginals']), [2, 0, 1])
+
     def test_single_variable(self):
         bqm = dimod.BinaryQuadraticModel.from_ising({'a': -1}, {})
 
@@ -121,6 +148,7 @@ class TestSample(unittest.TestCase):
         dict(bqm=dimod.BinaryQuadraticModel.from_qubo({'ab': .69, 'bc': 1, 'ac': .5})),
         dict(bqm=dimod.BinaryQuadraticModel.from_qubo({'ab': .69, 'bc': 1})),
         dict(bqm=dimod.AdjDictBQM({'a': 6.0, 0: 1}, {('a', 0): -3, (0, 'c'): 10}, 0, 'BINARY')),
+        dict(bqm=dimod.BinaryQuadraticModel.from_ising({0: .5}, {(0, 1): -1, (1, 2): .3, (0, 2): .2})),
 ])
 class TestMarginals(unittest.TestCase):
     def test_spin_log_partition_function(self):
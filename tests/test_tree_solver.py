@@ -15,10 +15,13 @@
 import inspect
 import itertools
 import unittest
+import unittest.mock
 
 import dimod
+import networkx as nx
 
 from dwave.samplers.tree import TreeDecompositionSolver
+from dwave.samplers.tree.utilities import min_fill_heuristic
 
 
 class TestConstruction(unittest.TestCase):
@@ -132,3 +135,32 @@ class TestSample(unittest.TestCase):
         sampleset = TreeDecompositionSolver().sample(bqm, num_reads=101)
 
         self.assertEqual(sum(sampleset.record.num_occurrences), 101)
+
+    def test_elimination_order_cached(self):
+        bqm = dimod.generators.gnp_random_bqm(10, .5, 'SPIN', random_state=5)
+        solver = TreeDecompositionSolver()
+
+        with unittest.mock.patch('dwave.samplers.tree.samplers.min_fill_heuristic',
+                                 wraps=min_fill_heuristic) as heuristic:
+            sampleset = solver.sample(bqm)
+            self.assertEqual(heuristic.call_count, 1)
+
+            # same structure, different biases
+            bqm2 = bqm.copy()
+            bqm2.scale(-1)
+            sampleset2 = solver.sample(bqm2)
+            self.assertEqual(heuristic.call_count, 1)
+
+            # same structure, constructed in a different order
+            bqm3 = dimod.BinaryQuadraticModel(bqm.linear, {}, 0, bqm.vartype)
+            for (u, v), bias in reversed(list(bqm.quadratic.items())):
+                bqm3.add_quadratic(v, u, bias)
+            solver.sample(bqm3)
+            self.assertEqual(heuristic.call_count, 1)
+
+            # new structure
+            bqm2.add_quadratic(*next(iter(nx.non_edges(nx.Graph(bqm.quadratic)))), 1)
+            sampleset2 = solver.sample(bqm2)
+            self.assertEqual(heuristic.call_count, 2)
+
+        dimod.testing.assert_response_energies(sampleset2, bqm2)